@@ -28,13 +28,70 @@ License: MIT
 # ========================================
 # IMPORTS - Required Python modules
 # ========================================
+import argparse  # For command-line options
+import collections  # For keeping batches of work queued up
 import csv  # For reading CSV files
+import functools  # For caching the Jinja2 environment between calls
+import itertools  # For splitting CSV rows into batches
+import mmap  # For reading large CSV files without extra copies
 import os  # For file system operations
+import pickle  # For checking that work can be sent to worker processes
 import sys  # For system operations and exit codes
+from concurrent.futures import ProcessPoolExecutor  # For rendering on all CPU cores
 from pathlib import Path  # For cross-platform path handling
-from typing import Dict, List  # For type hints
+from typing import (  # For type hints
+    IO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import jinja2  # For template processing
+from jinja2 import nodes  # For inspecting parsed templates
+
+# ========================================
+# SETTINGS
+# ========================================
+
+# Read buffer size for CSV files. A large buffer means fewer read calls
+# when scanning big CSV files from start to end.
+CSV_READ_BUFFER_SIZE = 1 << 20
+
+# CSV files at least this large are memory-mapped instead of read through
+# Python's file buffer, which saves copying the whole file an extra time.
+CSV_MMAP_THRESHOLD = 64 << 20
+
+# CSV files at least this large are split into byte ranges that worker
+# processes parse themselves, so the main process doesn't have to read and
+# hand over every row.
+CSV_SHARD_THRESHOLD = 8 << 20
+
+# Approximate size of each byte range. Small ranges keep the results a worker
+# holds on to bounded, and let progress stream back while the file is split.
+CSV_SHARD_SIZE = 1 << 20
+
+# Number of CSV rows handed to a worker process at a time. Larger chunks mean
+# less communication between processes.
+RENDER_CHUNK_SIZE = 64
+
+# Number of CSV rows read ahead of the worker processes. This keeps memory use
+# bounded when streaming very large CSV files.
+RENDER_BATCH_SIZE = RENDER_CHUNK_SIZE * 64
+
+# Number of progress lines collected before they are written to the screen.
+# Writing them in batches avoids a slow print() call for every row.
+PROGRESS_FLUSH_INTERVAL = 1000
+
+# Flags for opening output files at the OS level. O_BINARY only exists on
+# Windows, where it stops newlines from being translated.
+OUTPUT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
 
 # ========================================
@@ -42,6 +99,154 @@ import jinja2  # For template processing
 # ========================================
 
 
+def _iter_mmap_lines(
+    file: IO, byte_range: Optional[Tuple[int, int]] = None
+) -> Iterator[str]:
+    """
+    Yield the lines of an open file by memory-mapping it.
+
+    The operating system maps the file into memory directly, so lines are
+    decoded from the mapping without passing through Python's read buffer.
+
+    Args:
+        file: Open file object
+        byte_range: Start and end offsets to read (default: whole file);
+            both must fall on line boundaries
+
+    Yields:
+        Decoded lines, including their line endings
+    """
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start, end = byte_range if byte_range is not None else (0, len(mapped))
+        mapped.seek(start)
+        while mapped.tell() < end:
+            yield mapped.readline().decode("utf-8")
+
+
+def _read_csv_records(
+    csv_file_path: str,
+    delimiter: str = ";",
+    byte_range: Optional[Tuple[int, int]] = None,
+) -> Iterator[List[str]]:
+    """
+    Read CSV file lazily, yielding each row as a plain list of values.
+
+    The first item yielded is the header row, unless ``byte_range`` selects
+    a part of the file from _shard_csv(). Blank lines are skipped.
+
+    Args:
+        csv_file_path: Path to the CSV file
+        delimiter: CSV delimiter (default: semicolon)
+        byte_range: Start and end offsets of the part of the file to read
+
+    Yields:
+        Header row followed by one list of values per data row
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+    """
+    # Open the CSV file with UTF-8 encoding for international character support
+    # newline="" lets the csv module handle line endings itself, as documented
+    # Opening directly (instead of checking first) avoids an extra file
+    # system call and can't be fooled by the file disappearing in between
+    try:
+        file = open(
+            csv_file_path,
+            "r",
+            encoding="utf-8",
+            buffering=CSV_READ_BUFFER_SIZE,
+            newline="",
+        )
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"CSV file not found: {csv_file_path}") from e
+
+    with file:
+        lines: Iterable[str] = file
+        if byte_range is not None:
+            # Part of a file: read just those lines from a memory map
+            lines = _iter_mmap_lines(file, byte_range)
+        elif os.fstat(file.fileno()).st_size >= CSV_MMAP_THRESHOLD:
+            # Large file: read lines straight from a memory map instead
+            lines = _iter_mmap_lines(file)
+
+        for row in csv.reader(lines, delimiter=delimiter):
+            # Skip blank lines, just like csv.DictReader does
+            if row:
+                yield row
+
+
+def _shard_csv(csv_file_path: str, shard_size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Split the data rows of a CSV file into byte ranges of similar size.
+
+    Every range starts and ends on a line boundary, so each one can be parsed
+    on its own. Files containing quote characters return None, because a
+    quoted value may span several lines and can't be split safely.
+
+    Args:
+        csv_file_path: Path to the CSV file
+        shard_size: Approximate size of each byte range
+
+    Returns:
+        List of (start, end) byte offsets, or None if the file can't be split
+    """
+    with open(csv_file_path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        if mapped.find(b'"') != -1:
+            return None
+
+        # Data rows start after the header row, which is the first line that
+        # isn't blank (blank lines are skipped when reading the header too)
+        data_start = 0
+        while True:
+            newline = mapped.find(b"\n", data_start)
+            if newline == -1:
+                return None
+            blank = mapped[data_start:newline] in (b"", b"\r")
+            data_start = newline + 1
+            if not blank:
+                break
+
+        size = len(mapped)
+        bounds = [data_start]
+        while bounds[-1] < size:
+            # Move each split point forward to the end of its line
+            newline = mapped.find(b"\n", bounds[-1] + shard_size)
+            bounds.append(size if newline == -1 else newline + 1)
+
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def read_csv_rows(csv_file_path: str, delimiter: str = ";") -> Iterator[Dict[str, str]]:
+    """
+    Read CSV file lazily, yielding one dictionary per data row.
+
+    Works like read_csv_to_dict(), but rows are parsed only when they are
+    needed, so a large CSV file never has to be held in memory all at once.
+    The file stays open until all rows have been read.
+
+    Args:
+        csv_file_path: Path to the CSV file
+        delimiter: CSV delimiter (default: semicolon)
+
+    Yields:
+        Dictionaries where keys are CSV headers and values are row data
+
+    Raises:
+        FileNotFoundError: If the CSV file doesn't exist
+    """
+    # Read the first row (headers) once and pair it with each row ourselves,
+    # which avoids the extra per-row work csv.DictReader does
+    records = _read_csv_records(csv_file_path, delimiter)
+    headers = next(records, None)
+    if headers is None:
+        return
+
+    for row in records:
+        yield dict(zip(headers, row))
+
+
 def read_csv_to_dict(csv_file_path: str, delimiter: str = ";") -> List[Dict[str, str]]:
     """
     Read CSV file and convert it to a list of dictionaries.
@@ -62,27 +267,17 @@ def read_csv_to_dict(csv_file_path: str, delimiter: str = ";") -> List[Dict[str,
         FileNotFoundError: If the CSV file doesn't exist
         ValueError: If the CSV file is empty or malformed
     """
-    # Check if the CSV file exists before trying to read it
-    if not os.path.exists(csv_file_path):
-        raise FileNotFoundError(f"CSV file not found: {csv_file_path}")
-
-    config_parameters = []
-
     try:
-        # Open the CSV file with UTF-8 encoding for international character support
-        with open(csv_file_path, "r", encoding="utf-8") as file:
-            # Use csv.DictReader to automatically convert CSV rows to dictionaries
-            # This makes the first row (headers) the keys for all subsequent rows
-            csv_reader = csv.DictReader(file, delimiter=delimiter)
-            config_parameters = list(csv_reader)
+        # Collect every row produced by read_csv_rows() into a list
+        config_parameters = list(read_csv_rows(csv_file_path, delimiter))
+    except (csv.Error, UnicodeDecodeError) as e:
+        # Malformed CSV or bad encoding; a missing file raises
+        # FileNotFoundError as is
+        raise ValueError(f"Error reading CSV file: {e}") from e
 
-        # Validate that we actually have data to work with
-        if not config_parameters:
-            raise ValueError("CSV file is empty or has no data rows")
-
-    except Exception as e:
-        # Catch any file reading or parsing errors
-        raise ValueError(f"Error reading CSV file: {e}")
+    # Validate that we actually have data to work with
+    if not config_parameters:
+        raise ValueError("CSV file is empty or has no data rows")
 
     return config_parameters
 
@@ -92,7 +287,8 @@ def create_jinja_environment(template_dir: str = ".") -> jinja2.Environment:
     Create and configure Jinja2 environment.
 
     Jinja2 Environment controls how templates are loaded and processed.
-    We configure it with options that make templates cleaner and more readable.
+    We configure it with options that make templates cleaner and more readable,
+    and with an on-disk bytecode cache so templates are only compiled once.
 
     Args:
         template_dir: Directory containing Jinja2 templates
@@ -107,9 +303,25 @@ def create_jinja_environment(template_dir: str = ".") -> jinja2.Environment:
         trim_blocks=True,
         # lstrip_blocks removes leading whitespace from blocks
         lstrip_blocks=True,
+        # Store compiled templates on disk so later runs can skip compilation
+        # Without a directory argument, Jinja2 uses a private per-user cache
+        # directory (mode 0700) and checks its owner and permissions
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+        # Templates don't change during a run, so skip checking them for updates
+        auto_reload=False,
+        # Never drop compiled templates from the in-memory cache
+        cache_size=-1,
+        # Let the compiler pre-compute constant expressions
+        optimized=True,
     )
 
 
+# Reuse one Jinja2 environment per template directory. Creating a new
+# environment throws away its in-memory template cache, so keeping it around
+# makes later get_template() calls simple dictionary lookups.
+_get_env = functools.lru_cache(maxsize=8)(create_jinja_environment)
+
+
 def ensure_output_directory(output_dir: str) -> None:
     """
     Ensure the output directory exists, create if it doesn't.
@@ -126,44 +338,423 @@ def ensure_output_directory(output_dir: str) -> None:
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=8)
+def _get_segments(
+    template_dir: str, template_file: str
+) -> Optional[List[Tuple[Optional[bytes], Optional[str]]]]:
+    """
+    Split a simple template into fixed text and variable placeholders.
+
+    Most templates are plain text with {{ variable }} placeholders. For those,
+    the fixed text is encoded to bytes once, so each row only has to encode
+    its own values. Templates that use anything else (if/for blocks, filters,
+    expressions) return None and are rendered by Jinja2 as usual.
+
+    Args:
+        template_dir: Directory containing Jinja2 templates
+        template_file: Name of the Jinja2 template file
+
+    Returns:
+        List of (text, None) and (None, variable name) pairs, or None
+    """
+    env = _get_env(template_dir)
+    source, filename, _ = env.loader.get_source(env, template_file)
+    tree = env.parse(source, template_file, filename)
+
+    segments = []
+    for node in tree.body:
+        if not isinstance(node, nodes.Output):
+            return None
+        for child in node.nodes:
+            if isinstance(child, nodes.TemplateData):
+                segments.append((child.data.encode("utf-8"), None))
+            elif (
+                isinstance(child, nodes.Name)
+                and child.ctx == "load"
+                and child.name not in env.globals
+            ):
+                segments.append((None, child.name))
+            else:
+                return None
+    return segments
+
+
+def _column_positions(headers: Sequence[str]) -> Dict[str, int]:
+    """Map each CSV header to its column position (later duplicates win)."""
+    return {header: position for position, header in enumerate(headers)}
+
+
+@functools.lru_cache(maxsize=8)
+def _get_row_segments(
+    template_dir: str, template_file: str, headers: Tuple[str, ...]
+) -> Optional[List[Tuple[Optional[bytes], Optional[int]]]]:
+    """
+    Match the segments from _get_segments() to CSV column positions.
+
+    Variables that are not CSV headers become empty text, just like Jinja2
+    renders undefined variables.
+
+    Args:
+        template_dir: Directory containing Jinja2 templates
+        template_file: Name of the Jinja2 template file
+        headers: CSV header row
+
+    Returns:
+        List of (text, None) and (None, column position) pairs, or None
+    """
+    segments = _get_segments(template_dir, template_file)
+    if segments is None:
+        return None
+
+    columns = _column_positions(headers)
+    row_segments: List[Tuple[Optional[bytes], Optional[int]]] = []
+    for text, name in segments:
+        if name is None:
+            row_segments.append((text, None))
+        elif name in columns:
+            row_segments.append((None, columns[name]))
+        else:
+            row_segments.append((b"", None))
+    return row_segments
+
+
+def write_configuration(
+    template: jinja2.Template,
+    headers: Sequence[str],
+    row: List[str],
+    index: int,
+    output_prefix: str,
+    hostname_column: Optional[int] = None,
+    segments: Optional[List[Tuple[Optional[bytes], Optional[int]]]] = None,
+) -> str:
+    """
+    Render one configuration and save it to the output directory.
+
+    Rows are kept as plain lists of values and looked up by column position,
+    so no dictionary has to be built per row for simple templates.
+
+    Args:
+        template: Loaded Jinja2 template
+        headers: CSV header row
+        row: Values of one CSV row, in header order
+        index: Position of the row in the CSV file (starting at 1)
+        output_prefix: Output directory path ending with a path separator
+        hostname_column: Position of the "hostname" column, if there is one
+        segments: Pre-split template from _get_row_segments(), if available
+
+    Returns:
+        Name of the generated configuration file
+    """
+    # Render the template with current row's data
+    # This replaces all {{ variable }} placeholders with actual values
+    if segments is not None:
+        # Simple template: join the pre-encoded text with this row's values
+        # Values missing from short rows render as empty text
+        values = row
+        if len(values) < len(headers):
+            values = row + [""] * (len(headers) - len(row))
+        data = b"".join(
+            text if column is None else values[column].encode("utf-8")
+            for text, column in segments
+        )
+    else:
+        # Calling the compiled render function directly skips the extra setup
+        # template.render() repeats for every row
+        context = template.new_context(vars=dict(zip(headers, row)), shared=False)
+        data = "".join(template.root_render_func(context)).encode("utf-8")
+
+    # Get hostname from CSV data, or create a default name
+    # Hostname is used as the filename for the generated config
+    if hostname_column is not None and hostname_column < len(row):
+        hostname = row[hostname_column]
+    else:
+        hostname = f"config_{index}"
+    config_filename = hostname + ".cfg"
+    config_path = output_prefix + config_filename
+
+    # Write the rendered configuration to a file
+    # The config is already a single block of bytes, so it is written straight
+    # to the file descriptor without Python's file object and buffer layers
+    # It goes to a temporary file first and is then renamed into place, so
+    # two processes writing the same file name can never mix their contents
+    temp_path = f"{config_path}.{os.getpid()}.tmp"
+    fd = os.open(temp_path, OUTPUT_OPEN_FLAGS, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(temp_path, config_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+    return config_filename
+
+
+def _generate_one(
+    template_dir: str,
+    template_file: str,
+    output_prefix: str,
+    headers: Tuple[str, ...],
+    hostname_column: Optional[int],
+    entry: Tuple[int, List[str]],
+) -> Tuple[int, str, Optional[str]]:
+    """
+    Generate the configuration for one CSV row (runs inside a worker process).
+
+    Each process keeps its own cached Jinja2 environment, so the template is
+    only loaded once per process, from the shared bytecode cache.
+
+    Args:
+        template_dir: Directory containing Jinja2 templates
+        template_file: Name of the Jinja2 template file
+        output_prefix: Output directory path ending with a path separator
+        headers: CSV header row
+        hostname_column: Position of the "hostname" column, if there is one
+        entry: Row position (starting at 1) and the row's values
+
+    Returns:
+        Tuple of row position, generated filename and error message (or None)
+    """
+    index, row = entry
+    try:
+        template = _get_env(template_dir).get_template(template_file)
+        segments = _get_row_segments(template_dir, template_file, headers)
+        config_filename = write_configuration(
+            template, headers, row, index, output_prefix, hostname_column, segments
+        )
+        return index, config_filename, None
+    except Exception as e:
+        # Report the error back instead of stopping the whole run
+        return index, "", str(e)
+
+
+def _generate_shard(
+    template_dir: str,
+    template_file: str,
+    output_prefix: str,
+    headers: Tuple[str, ...],
+    hostname_column: int,
+    csv_file: str,
+    delimiter: str,
+    byte_range: Tuple[int, int],
+) -> Tuple[int, List[Tuple[int, str, Optional[str]]], List[Tuple[int, List[str]]]]:
+    """
+    Generate the configurations for one byte range of the CSV file.
+
+    Runs inside a worker process, which parses its own part of the CSV file
+    and renders it with its own cached Jinja2 environment.
+
+    Rows without a hostname value are named after their row number in the
+    whole file, which the worker doesn't know. Those rows are handed back to
+    be generated by the main process instead.
+
+    Args:
+        template_dir: Directory containing Jinja2 templates
+        template_file: Name of the Jinja2 template file
+        output_prefix: Output directory path ending with a path separator
+        headers: CSV header row
+        hostname_column: Position of the "hostname" column
+        csv_file: Path to the CSV file
+        delimiter: CSV delimiter
+        byte_range: Start and end offsets from _shard_csv()
+
+    Returns:
+        Number of rows in this byte range, the results of every generated
+        row (the main process needs all file names to spot repeated ones),
+        and the rows left for the main process, all numbered from 1 within
+        the range
+    """
+    processed = 0
+    reported = []
+    deferred = []
+    records = _read_csv_records(csv_file, delimiter, byte_range)
+    for processed, row in enumerate(records, 1):
+        if hostname_column >= len(row):
+            deferred.append((processed, row))
+            continue
+
+        result = _generate_one(
+            template_dir,
+            template_file,
+            output_prefix,
+            headers,
+            hostname_column,
+            (processed, row),
+        )
+        reported.append(result)
+    return processed, reported, deferred
+
+
+def _renumber_shard_results(
+    shard_results: Iterable[
+        Tuple[int, List[Tuple[int, str, Optional[str]]], List[Tuple[int, List[str]]]]
+    ],
+    generate_one: Callable[[Tuple[int, List[str]]], Tuple[int, str, Optional[str]]],
+) -> Iterator[Tuple[int, List[Tuple[int, str, Optional[str]]]]]:
+    """
+    Turn row numbers within each byte range into row numbers in the file.
+
+    Rows the workers handed back are generated here with their file-wide
+    row number, and merged into the results in CSV order.
+
+    Args:
+        shard_results: Results of _generate_shard(), in file order
+        generate_one: Generates one (row number, row) entry in this process
+
+    Yields:
+        Number of rows processed, and the results to report
+    """
+    offset = 0
+    for processed, reported, deferred in shard_results:
+        results = [(offset + i, name, error) for i, name, error in reported]
+        if deferred:
+            results.extend(generate_one((offset + i, row)) for i, row in deferred)
+            results.sort(key=lambda result: result[0])
+        yield processed, results
+        offset += processed
+
+
+def _regenerate_rows(
+    csv_file: str,
+    delimiter: str,
+    rows: Set[int],
+    generate_one: Callable[[Tuple[int, List[str]]], Tuple[int, str, Optional[str]]],
+) -> Iterator[Tuple[int, str, Optional[str]]]:
+    """
+    Generate selected CSV rows again, in this process and in CSV order.
+
+    Args:
+        csv_file: Path to the CSV file
+        delimiter: CSV delimiter
+        rows: Row positions (starting at 1) to generate again
+        generate_one: Generates one (row number, row) entry in this process
+
+    Yields:
+        Tuple of row position, generated filename and error message (or None)
+    """
+    remaining = len(rows)
+    records = _read_csv_records(csv_file, delimiter)
+    next(records, None)
+    for index, row in enumerate(records, 1):
+        if remaining == 0:
+            break
+        if index in rows:
+            remaining -= 1
+            yield generate_one((index, row))
+    records.close()
+
+
+def _batched(iterable: Iterable, size: int) -> Iterator[list]:
+    """Split an iterable into lists of at most ``size`` items."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _map_ahead(
+    executor: ProcessPoolExecutor,
+    fn: Callable,
+    batches: Iterable[list],
+    chunksize: int = 1,
+) -> Iterator[Tuple[int, Iterator]]:
+    """
+    Run ``fn`` over batches of items in the pool, one batch ahead.
+
+    The next batch is submitted before results of the current one are
+    handed out, so workers keep busy while the caller reads the next batch
+    and reports results.
+
+    Args:
+        executor: Pool of worker processes
+        fn: Function to call for every item
+        batches: Lists of items
+        chunksize: Number of items sent to a worker at a time
+
+    Yields:
+        Number of items in each batch, and an iterator over its results
+    """
+    pending: Deque[Tuple[int, Iterator]] = collections.deque()
+    for batch in batches:
+        pending.append((len(batch), executor.map(fn, batch, chunksize=chunksize)))
+        if len(pending) > 1:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
+
+
+def _flush_progress(progress: List[str]) -> None:
+    """Write collected progress lines to the screen in one go and clear them."""
+    if progress:
+        sys.stdout.write("\n".join(progress) + "\n")
+        progress.clear()
+
+
 def generate_configurations(
     template_file: str,
     csv_file: str,
     output_dir: str = "_output",
     template_dir: str = ".",
+    jobs: Optional[int] = 1,
+    verbose: bool = True,
+    delimiter: str = ";",
 ) -> None:
     """
     Generate configuration files from CSV data using Jinja2 templates.
 
     This is the main processing function that coordinates all the steps:
-    1. Read CSV data
+    1. Open CSV data
     2. Set up Jinja2 environment
     3. Load template
     4. Generate configs for each CSV row
     5. Save output files
 
+    Every CSV row is independent, so rows can be rendered in parallel across
+    several worker processes by setting ``jobs``. Large CSV files are split
+    into byte ranges so that each worker also parses its own part.
+
+    Worker processes need to import this script by name, which works when it
+    runs as ``__main__``. When it was loaded some other way (for example with
+    importlib, without registering it in ``sys.modules``), rendering falls
+    back to this process.
+
     Args:
         template_file: Name of the Jinja2 template file
         csv_file: Path to the CSV file containing parameters
         output_dir: Directory to save generated configurations
         template_dir: Directory containing Jinja2 templates
+        jobs: Number of worker processes (default: 1, which renders in this
+            process; None uses one per CPU core)
+        verbose: List every generated file (errors are always shown)
+        delimiter: CSV delimiter (default: semicolon)
     """
     # ========================================
-    # STEP 1: READ AND VALIDATE CSV DATA
+    # STEP 1: OPEN CSV DATA
     # ========================================
+    # Rows are read lazily while configurations are generated, so even very
+    # large CSV files don't need to fit in memory
+    # Rows stay plain lists of values; only the header row is kept separately
     print(f"Reading CSV parameter file: {csv_file}...")
-    config_parameters = read_csv_to_dict(csv_file)
-    print(f"Found {len(config_parameters)} configuration entries")
+    config_records = _read_csv_records(csv_file, delimiter)
+    headers = tuple(next(config_records, ()))
+    hostname_column = _column_positions(headers).get("hostname")
 
     # ========================================
     # STEP 2: SETUP JINJA2 TEMPLATE ENGINE
     # ========================================
     print("Creating Jinja2 environment...")
-    env = create_jinja_environment(template_dir)
+    env = _get_env(template_dir)
 
     # Load the template file and handle any errors
+    # This also fills the bytecode cache before any worker process needs it
     try:
-        template = env.get_template(template_file)
+        env.get_template(template_file)
     except jinja2.TemplateNotFound:
         raise FileNotFoundError(f"Template file not found: {template_file}")
 
@@ -177,36 +768,159 @@ def generate_configurations(
     # STEP 4: GENERATE CONFIGURATION FILES
     # ========================================
     print("Generating configuration files...")
-    for i, parameter in enumerate(config_parameters, 1):
+    # Work out the output path prefix once, instead of calling os.path.join()
+    # for every row; joining with "" adds a separator only when needed
+    output_prefix = os.path.join(output_dir, "")
+    generate_one = functools.partial(
+        _generate_one,
+        template_dir,
+        template_file,
+        output_prefix,
+        headers,
+        hostname_column,
+    )
+    entries = enumerate(config_records, 1)
+
+    # Worker processes receive their work by pickling, which only works when
+    # they can import this script by name; otherwise render in this process
+    if jobs != 1:
         try:
-            # Render the template with current row's data
-            # This replaces all {{ variable }} placeholders with actual values
-            result = template.render(parameter)
-
-            # Get hostname from CSV data, or create a default name
-            # Hostname is used as the filename for the generated config
-            hostname = parameter.get("hostname", f"config_{i}")
-            config_filename = f"{hostname}.cfg"
-            config_path = os.path.join(output_dir, config_filename)
-
-            # Write the rendered configuration to a file
-            with open(config_path, "w", encoding="utf-8") as config_file:
-                config_file.write(result)
-
-            # Show progress to user
-            print(f"  [{i}/{len(config_parameters)}] Created: {config_filename}")
-
-        except Exception as e:
-            # If there's an error with one config, continue with the rest
-            print(f"  Error generating config for entry {i}: {e}")
-            continue
+            pickle.dumps(generate_one)
+        except (pickle.PicklingError, AttributeError):
+            print("  Can't use worker processes here, rendering in this process")
+            jobs = 1
+
+    # Large files can be split into byte ranges that workers parse themselves
+    # Without a hostname column, file names depend on row numbers across the
+    # whole file, so those files are not split
+    shards = None
+    if (
+        jobs != 1
+        and hostname_column is not None
+        and os.path.getsize(csv_file) >= CSV_SHARD_THRESHOLD
+    ):
+        shards = _shard_csv(csv_file, CSV_SHARD_SIZE)
+
+    # Results arrive in batches of (rows processed, results to report)
+    executor = None
+    if jobs == 1:
+        # Render everything in this process
+        results = (
+            (len(batch), map(generate_one, batch))
+            for batch in _batched(entries, RENDER_BATCH_SIZE)
+        )
+    elif shards is not None:
+        # Each worker process parses and renders its own part of the file
+        config_records.close()
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        generate_shard = functools.partial(
+            _generate_shard,
+            template_dir,
+            template_file,
+            output_prefix,
+            headers,
+            hostname_column,
+            csv_file,
+            delimiter,
+        )
+        # Hand out a few byte ranges per worker at a time, so finished
+        # results don't pile up while the main process reports them, and
+        # keep the next group queued so workers don't wait between groups
+        workers = jobs or os.cpu_count() or 1
+        shard_results = itertools.chain.from_iterable(
+            group
+            for _, group in _map_ahead(
+                executor, generate_shard, _batched(shards, workers * 4)
+            )
+        )
+        results = _renumber_shard_results(shard_results, generate_one)
+    else:
+        # Hand batches of rows to a pool of worker processes, keeping the next
+        # batch queued so workers don't wait while it is read from the CSV
+        # Results come back in CSV order
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        results = _map_ahead(
+            executor,
+            generate_one,
+            _batched(entries, RENDER_BATCH_SIZE),
+            chunksize=RENDER_CHUNK_SIZE,
+        )
+
+    # Several rows can share a file name (a repeated hostname). Rendering in
+    # this process, the last of them wins; worker processes may finish them in
+    # any order, so remember where each file name was last used
+    last_rows: Optional[Dict[str, int]] = None if executor is None else {}
+    repeated: Set[str] = set()
 
+    count = 0
+    progress: List[str] = []
+    try:
+        for processed, batch_results in results:
+            count += processed
+            for i, config_filename, error in batch_results:
+                if last_rows is not None and error is None:
+                    if config_filename in last_rows:
+                        repeated.add(config_filename)
+                    last_rows[config_filename] = i
+
+                if error is not None:
+                    # If there's an error with one config, continue with the rest
+                    # Errors are always reported, even in quiet mode
+                    progress.append(f"  Error generating config for entry {i}: {error}")
+                elif verbose:
+                    # Show progress to user
+                    progress.append(f"  [{i}] Created: {config_filename}")
+
+                if len(progress) >= PROGRESS_FLUSH_INTERVAL:
+                    _flush_progress(progress)
+    finally:
+        _flush_progress(progress)
+        if executor is not None:
+            executor.shutdown()
+
+    if repeated:
+        # Write the last row for each repeated file name again, now that no
+        # worker process can overwrite it any more
+        rows = {last_rows[config_filename] for config_filename in repeated}
+        for i, config_filename, error in _regenerate_rows(
+            csv_file, delimiter, rows, generate_one
+        ):
+            if error is not None:
+                progress.append(f"  Error generating config for entry {i}: {error}")
+        _flush_progress(progress)
+
+    # Validate that we actually had data to work with
+    if count == 0:
+        raise ValueError("CSV file is empty or has no data rows")
+
+    print(f"Processed {count} configuration entries")
     print("Configuration generation completed!")
 
 
 def main():
     """Main function to run the configuration generator."""
 
+    # Command-line options
+    parser = argparse.ArgumentParser(
+        description="Generate configuration files from CSV data using Jinja2 templates."
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes (default: number of CPU cores)",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="don't list every generated configuration file",
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     # ========================================
     # CONFIGURATION SECTION - MODIFY THESE VALUES
     # ========================================
@@ -230,7 +944,11 @@ def main():
     try:
         # Run the configuration generation process
         generate_configurations(
-            template_file=template_file, csv_file=csv_file, output_dir=output_directory
+            template_file=template_file,
+            csv_file=csv_file,
+            output_dir=output_directory,
+            jobs=args.jobs,
+            verbose=not args.quiet,
         )
     except Exception as e:
         # Handle any errors that occur during execution